@@ -4,12 +4,175 @@ BigQuery schema inspection script.
 Retrieves and displays table schema information.
 """
 
+import os
+import re
 import sys
 import json
+import functools
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import google.auth
+import requests
+from google.auth.transport.requests import AuthorizedSession
 from google.cloud import bigquery
 from google.oauth2 import service_account
 
+try:
+    import orjson
+    
+    def _dumps(obj) -> str:
+        """Serialize obj as indented JSON, using orjson when installed."""
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+except ImportError:
+    def _dumps(obj) -> str:
+        """Serialize obj as indented JSON, using orjson when installed."""
+        return json.dumps(obj, indent=2, default=str)
+
+
+def _create_client(project_id: str = None, credentials_path: str = None):
+    """Build a BigQuery client from a service account file or default auth."""
+    if credentials_path:
+        credentials = service_account.Credentials.from_service_account_file(
+            credentials_path
+        )
+        return bigquery.Client(credentials=credentials, project=project_id)
+    return bigquery.Client(project=project_id)
+
+
+_cached_client = functools.lru_cache(maxsize=8)(_create_client)
+
+
+def _create_pooled_client(
+    project_id: str = None,
+    credentials_path: str = None,
+    pool_size: int = 10
+):
+    """
+    Build a BigQuery client whose HTTP session keeps pool_size connections per host.
+    
+    requests keeps 10 connections per host by default, so more concurrent
+    callers than that on one client keep discarding and reopening connections.
+    The client gets its own session rather than resizing a shared one.
+    """
+    if credentials_path:
+        credentials = service_account.Credentials.from_service_account_file(
+            credentials_path,
+            scopes=bigquery.Client.SCOPE
+        )
+        default_project = None
+    else:
+        credentials, default_project = google.auth.default(scopes=bigquery.Client.SCOPE)
+    
+    session = AuthorizedSession(credentials)
+    session.configure_mtls_channel()
+    if not session.is_mtls:
+        session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=pool_size))
+    return bigquery.Client(
+        project=project_id or default_project,
+        credentials=credentials,
+        _http=session
+    )
+
+
+def _get_client(project_id: str = None, credentials_path: str = None):
+    """
+    Return a BigQuery client for the given project and credentials.
+    
+    Clients are memoized per (project_id, credentials_path) so repeated
+    calls in one process skip the credential load and token exchange.
+    Set BQ_REUSE_CLIENT=0 to build a fresh client on every call.
+    """
+    if os.environ.get("BQ_REUSE_CLIENT", "1") == "1":
+        return _cached_client(project_id, credentials_path)
+    return _create_client(project_id, credentials_path)
+
+
+def format_schema(schema_info: dict, output_format: str = "json"):
+    """
+    Format a single table's schema information.
+    
+    Args:
+        schema_info: Schema dict as built by get_table_schema
+        output_format: Output format - 'json' or 'markdown'
+        
+    Returns:
+        Table schema in the specified format
+    """
+    table_ref = schema_info["table"]
+    if output_format == "json":
+        output = _dumps(schema_info)
+    elif output_format == "markdown":
+        description = schema_info.get("description")
+        description_md = f"{description}\n\n" if description else ""
+        fields_md = "".join(
+            f"| {field['name']} | {field['type']} | {field['mode']} | {field.get('description', '')} |\n"
+            for field in schema_info["fields"]
+        )
+        output = (
+            f"# Table: {table_ref}\n\n"
+            f"{description_md}"
+            f"**Rows:** {schema_info['num_rows'] or 0:,} | "
+            f"**Size:** {schema_info['num_bytes'] or 0:,} bytes\n\n"
+            "## Fields\n\n"
+            "| Name | Type | Mode | Description |\n"
+            "|------|------|------|-------------|\n"
+            f"{fields_md}"
+        )
+    else:
+        output = _dumps(schema_info)
+    
+    return output
+
+
+def format_schemas(schemas: list, output_format: str = "json"):
+    """
+    Format schema information for several tables.
+    
+    Args:
+        schemas: List of schema dicts as built by get_table_schema
+        output_format: Output format - 'json' or 'markdown'
+        
+    Returns:
+        Table schemas in the specified format
+    """
+    if output_format == "markdown":
+        return "\n".join(
+            format_schema(schema_info, output_format)
+            for schema_info in schemas
+        )
+    return _dumps(schemas)
+
+
+def _table_schema_info(table_ref: str, table) -> dict:
+    """Extract schema information from a bigquery.Table."""
+    # Descriptions are omitted when empty to keep the output small
+    schema_info = {
+        "table": table_ref,
+        "num_rows": table.num_rows,
+        "num_bytes": table.num_bytes,
+        "created": str(table.created),
+        "modified": str(table.modified),
+        "fields": []
+    }
+    if table.description:
+        schema_info["description"] = table.description
+    
+    for field in table.schema:
+        field_info = {
+            "name": field.name,
+            "type": field.field_type,
+            "mode": field.mode
+        }
+        if field.description:
+            field_info["description"] = field.description
+        schema_info["fields"].append(field_info)
+    
+    return schema_info
+
 
 def get_table_schema(
     dataset_id: str,
@@ -33,56 +196,16 @@ def get_table_schema(
     """
     try:
         # Initialize client
-        if credentials_path:
-            credentials = service_account.Credentials.from_service_account_file(
-                credentials_path
-            )
-            client = bigquery.Client(credentials=credentials, project=project_id)
-        else:
-            client = bigquery.Client(project=project_id)
+        client = _get_client(project_id, credentials_path)
         
         # Get table reference
         table_ref = f"{project_id}.{dataset_id}.{table_id}"
         table = client.get_table(table_ref)
         
         # Extract schema information
-        schema_info = {
-            "table": table_ref,
-            "description": table.description or "",
-            "num_rows": table.num_rows,
-            "num_bytes": table.num_bytes,
-            "created": str(table.created),
-            "modified": str(table.modified),
-            "fields": []
-        }
+        schema_info = _table_schema_info(table_ref, table)
         
-        for field in table.schema:
-            field_info = {
-                "name": field.name,
-                "type": field.field_type,
-                "mode": field.mode,
-                "description": field.description or ""
-            }
-            schema_info["fields"].append(field_info)
-        
-        # Format output
-        if output_format == "json":
-            output = json.dumps(schema_info, indent=2)
-        elif output_format == "markdown":
-            output = f"# Table: {table_ref}\n\n"
-            if schema_info["description"]:
-                output += f"{schema_info['description']}\n\n"
-            output += f"**Rows:** {schema_info['num_rows']:,} | "
-            output += f"**Size:** {schema_info['num_bytes']:,} bytes\n\n"
-            output += "## Fields\n\n"
-            output += "| Name | Type | Mode | Description |\n"
-            output += "|------|------|------|-------------|\n"
-            for field in schema_info["fields"]:
-                output += f"| {field['name']} | {field['type']} | {field['mode']} | {field['description']} |\n"
-        else:
-            output = json.dumps(schema_info, indent=2)
-        
-        return output
+        return format_schema(schema_info, output_format)
         
     except Exception as e:
         print(f"Error retrieving schema: {str(e)}", file=sys.stderr)
@@ -107,13 +230,7 @@ def list_tables(
     """
     try:
         # Initialize client
-        if credentials_path:
-            credentials = service_account.Credentials.from_service_account_file(
-                credentials_path
-            )
-            client = bigquery.Client(credentials=credentials, project=project_id)
-        else:
-            client = bigquery.Client(project=project_id)
+        client = _get_client(project_id, credentials_path)
         
         # List tables
         dataset_ref = f"{project_id}.{dataset_id}"
@@ -127,13 +244,205 @@ def list_tables(
                 "table_type": table.table_type
             })
         
-        return json.dumps(table_list, indent=2)
+        return _dumps(table_list)
         
     except Exception as e:
         print(f"Error listing tables: {str(e)}", file=sys.stderr)
         sys.exit(1)
 
 
+ALL_SCHEMAS_QUERY = """
+SELECT
+  c.table_name,
+  c.column_name,
+  c.data_type,
+  c.is_nullable,
+  p.description,
+  o.option_value AS table_description,
+  IFNULL(t.row_count, 0) AS num_rows,
+  IFNULL(t.size_bytes, 0) AS num_bytes,
+  TIMESTAMP_MILLIS(t.creation_time) AS created,
+  TIMESTAMP_MILLIS(t.last_modified_time) AS modified
+FROM `{dataset_ref}.INFORMATION_SCHEMA.COLUMNS` AS c
+LEFT JOIN `{dataset_ref}.INFORMATION_SCHEMA.COLUMN_FIELD_PATHS` AS p
+  ON p.table_name = c.table_name
+  AND p.column_name = c.column_name
+  AND p.field_path = c.column_name
+LEFT JOIN `{dataset_ref}.INFORMATION_SCHEMA.TABLE_OPTIONS` AS o
+  ON o.table_name = c.table_name
+  AND o.option_name = 'description'
+LEFT JOIN `{dataset_ref}.__TABLES__` AS t
+  ON t.table_id = c.table_name
+WHERE c.is_hidden = 'NO'
+ORDER BY c.table_name, c.ordinal_position
+"""
+
+# INFORMATION_SCHEMA reports GoogleSQL type names, while get_table() reports
+# the legacy names, so map them to keep the schema_info shape identical
+_LEGACY_TYPE_NAMES = {
+    "INT64": "INTEGER",
+    "FLOAT64": "FLOAT",
+    "BOOL": "BOOLEAN",
+    "STRUCT": "RECORD"
+}
+
+_SQL_ESCAPE_RE = re.compile(
+    r"\\(?:x([0-9a-fA-F]{2})|u([0-9a-fA-F]{4})|U([0-9a-fA-F]{8})|([0-7]{3})|(.))",
+    re.DOTALL
+)
+_SQL_ESCAPES = {"a": "\a", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t", "v": "\v"}
+
+
+def _legacy_field_type(data_type: str) -> str:
+    """Map an INFORMATION_SCHEMA data_type to the field_type get_table() reports."""
+    if data_type.startswith("ARRAY<"):
+        data_type = data_type[len("ARRAY<"):-1]
+    # Drop type parameters and element types, e.g. STRING(10) or STRUCT<...>
+    base_type = re.match(r"\w+", data_type).group(0)
+    return _LEGACY_TYPE_NAMES.get(base_type, base_type)
+
+
+def _unescape_sql_string(match) -> str:
+    """Decode one escape sequence of a GoogleSQL string literal."""
+    hex_digits = match.group(1) or match.group(2) or match.group(3)
+    if hex_digits:
+        return chr(int(hex_digits, 16))
+    if match.group(4):
+        return chr(int(match.group(4), 8))
+    return _SQL_ESCAPES.get(match.group(5), match.group(5))
+
+
+def _decode_sql_string(literal: str) -> str:
+    """Decode a quoted GoogleSQL string literal such as TABLE_OPTIONS values."""
+    if len(literal) >= 2 and literal[0] in "\"'" and literal[-1] == literal[0]:
+        literal = literal[1:-1]
+    return _SQL_ESCAPE_RE.sub(_unescape_sql_string, literal)
+
+
+def get_all_schemas(
+    dataset_id: str,
+    project_id: str = None,
+    credentials_path: str = None,
+    output_format: str = "json"
+):
+    """
+    Retrieve schema information for every table in a dataset.
+    
+    Uses a single INFORMATION_SCHEMA query instead of one get_table()
+    call per table, so the cost stays constant as the dataset grows.
+    Hidden pseudo-columns such as _PARTITIONTIME are skipped and types
+    are reported with their legacy names, matching get_table_schema().
+    
+    Args:
+        dataset_id: Dataset ID
+        project_id: GCP project ID
+        credentials_path: Path to service account JSON
+        output_format: Output format - 'json' or 'markdown'
+        
+    Returns:
+        Table schemas in the specified format
+    """
+    try:
+        # Initialize client
+        client = _get_client(project_id, credentials_path)
+        
+        dataset_ref = f"{project_id or client.project}.{dataset_id}"
+        rows = client.query(ALL_SCHEMAS_QUERY.format(dataset_ref=dataset_ref)).result()
+        
+        # Group column rows into one schema_info per table
+        schemas = {}
+        for row in rows:
+            schema_info = schemas.get(row.table_name)
+            if schema_info is None:
+                schema_info = schemas[row.table_name] = {
+                    "table": f"{dataset_ref}.{row.table_name}",
+                    "num_rows": row.num_rows,
+                    "num_bytes": row.num_bytes,
+                    "created": str(row.created),
+                    "modified": str(row.modified),
+                    "fields": []
+                }
+                # TABLE_OPTIONS stores the description as a quoted string literal
+                if row.table_description:
+                    schema_info["description"] = _decode_sql_string(row.table_description)
+            
+            if row.data_type.startswith("ARRAY<"):
+                mode = "REPEATED"
+            elif row.is_nullable == "YES":
+                mode = "NULLABLE"
+            else:
+                mode = "REQUIRED"
+            
+            field_info = {
+                "name": row.column_name,
+                "type": _legacy_field_type(row.data_type),
+                "mode": mode
+            }
+            if row.description:
+                field_info["description"] = row.description
+            schema_info["fields"].append(field_info)
+        
+        return format_schemas(list(schemas.values()), output_format)
+        
+    except Exception as e:
+        print(f"Error retrieving schemas: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+
+
+def get_schemas_parallel(
+    dataset_id: str,
+    table_ids: list = None,
+    project_id: str = None,
+    credentials_path: str = None,
+    output_format: str = "json",
+    max_workers: int = 32
+):
+    """
+    Retrieve schema information for tables with concurrent get_table() calls.
+    
+    Slower and more API-heavy than get_all_schemas() for whole datasets,
+    but returns exactly what get_table_schema() would for each table.
+    
+    Args:
+        dataset_id: Dataset ID
+        table_ids: Table IDs to fetch (default: every table in the dataset)
+        project_id: GCP project ID
+        credentials_path: Path to service account JSON
+        output_format: Output format - 'json' or 'markdown'
+        max_workers: Number of concurrent get_table() calls (also the
+            size of the client's HTTP connection pool)
+            
+    Returns:
+        Table schemas in the specified format
+    """
+    try:
+        # Initialize a client with one pooled connection per worker
+        client = _create_pooled_client(project_id, credentials_path, max_workers)
+        
+        dataset_ref = f"{project_id or client.project}.{dataset_id}"
+        if table_ids is None:
+            table_ids = [table.table_id for table in client.list_tables(dataset_ref)]
+        
+        # The client is thread-safe, so one instance serves every worker
+        schemas = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(client.get_table, f"{dataset_ref}.{table_id}"): table_id
+                for table_id in table_ids
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                table_id = futures[future]
+                table_ref = f"{dataset_ref}.{table_id}"
+                schemas[table_id] = _table_schema_info(table_ref, future.result())
+                print(f"Fetched {done}/{len(futures)}: {table_ref}", file=sys.stderr)
+        
+        return format_schemas([schemas[table_id] for table_id in table_ids], output_format)
+        
+    except Exception as e:
+        print(f"Error retrieving schemas: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Inspect BigQuery table schemas")
     subparsers = parser.add_subparsers(dest="command", help="Command to execute")
@@ -157,6 +466,36 @@ def main():
     list_parser.add_argument("--project-id", help="GCP project ID")
     list_parser.add_argument("--credentials", help="Path to service account JSON")
     
+    # Schema-all command
+    schema_all_parser = subparsers.add_parser(
+        "schema-all",
+        help="Get schemas of all tables in dataset",
+        description="Get schemas of all tables in a dataset. By default this runs a "
+                    "single INFORMATION_SCHEMA query, which is the fastest option for "
+                    "whole datasets. --parallel instead issues one get_table() API call "
+                    "per table concurrently; use it when INFORMATION_SCHEMA is not "
+                    "readable or to fetch only a few tables with --tables."
+    )
+    schema_all_parser.add_argument("dataset", help="Dataset ID")
+    schema_all_parser.add_argument("--project-id", help="GCP project ID")
+    schema_all_parser.add_argument("--credentials", help="Path to service account JSON")
+    schema_all_parser.add_argument(
+        "--format",
+        choices=["json", "markdown"],
+        default="json",
+        help="Output format"
+    )
+    schema_all_parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Fetch each table with concurrent get_table() calls instead of INFORMATION_SCHEMA"
+    )
+    schema_all_parser.add_argument(
+        "--tables",
+        nargs="+",
+        help="Only fetch these table IDs (implies --parallel)"
+    )
+    
     args = parser.parse_args()
     
     if args.command == "schema":
@@ -173,6 +512,21 @@ def main():
             project_id=args.project_id,
             credentials_path=args.credentials
         )
+    elif args.command == "schema-all" and (args.parallel or args.tables):
+        result = get_schemas_parallel(
+            dataset_id=args.dataset,
+            table_ids=args.tables,
+            project_id=args.project_id,
+            credentials_path=args.credentials,
+            output_format=args.format
+        )
+    elif args.command == "schema-all":
+        result = get_all_schemas(
+            dataset_id=args.dataset,
+            project_id=args.project_id,
+            credentials_path=args.credentials,
+            output_format=args.format
+        )
     else:
         parser.print_help()
         sys.exit(1)
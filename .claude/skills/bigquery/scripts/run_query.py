@@ -1,25 +1,141 @@
 #!/usr/bin/env python3
 """
 BigQuery query execution script.
-Executes a SQL query and returns results in a specified format.
+Executes a SQL query and streams results to stdout in a specified format.
 """
 
+import io
+import os
+import re
+import csv
 import sys
 import json
+import mmap
+import time
+import shutil
+import hashlib
+import tempfile
+import functools
+import itertools
+import contextlib
 import argparse
+import google.auth
 from google.cloud import bigquery
 from google.oauth2 import service_account
 
+try:
+    import orjson
+    
+    def _dumps(obj) -> str:
+        """Serialize obj as indented JSON, using orjson when installed."""
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+except ImportError:
+    def _dumps(obj) -> str:
+        """Serialize obj as indented JSON, using orjson when installed."""
+        return json.dumps(obj, indent=2, default=str)
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+try:
+    from google.cloud import bigquery_storage
+except ImportError:
+    bigquery_storage = None
+
+CACHE_DIR = os.path.expanduser("~/.cache/bq-runquery")
+DEFAULT_CACHE_TTL = 3600
+
+# String literals (including triple-quoted and r/b-prefixed ones) and quoted
+# identifiers are kept verbatim; comments and runs of whitespace outside
+# them collapse to a single space. Triple quotes must be tried before
+# single quotes, otherwise ''' would be read as an empty literal.
+_SQL_TOKEN_RE = re.compile(
+    r"((?:[rR][bB]?|[bB][rR]?)?"
+    r"(?:'''(?:\\.|[^\\])*?'''|\"\"\"(?:\\.|[^\\])*?\"\"\""
+    r"|'(?:\\.|[^'\\])*'|\"(?:\\.|[^\"\\])*\")"
+    r"|`[^`]*`)"
+    r"|(?:\s|--[^\n]*|#[^\n]*|/\*.*?\*/)+",
+    re.DOTALL
+)
+
+
+def _create_client(project_id: str = None, credentials_path: str = None):
+    """
+    Build a BigQuery client from a service account file or default auth.
+    
+    Returns:
+        Tuple of (client, credentials); the credentials are returned so
+        other API clients can be built with the same credentials object
+    """
+    if credentials_path:
+        credentials = service_account.Credentials.from_service_account_file(
+            credentials_path,
+            scopes=bigquery.Client.SCOPE
+        )
+    else:
+        credentials, default_project = google.auth.default(scopes=bigquery.Client.SCOPE)
+        project_id = project_id or default_project
+    return bigquery.Client(credentials=credentials, project=project_id), credentials
+
+
+_cached_client = functools.lru_cache(maxsize=8)(_create_client)
+
+
+def _get_client(project_id: str = None, credentials_path: str = None):
+    """
+    Return a (client, credentials) pair for the given project and credentials.
+    
+    Clients are memoized per (project_id, credentials_path) so repeated
+    calls in one process skip the credential load and token exchange.
+    Set BQ_REUSE_CLIENT=0 to build a fresh client on every call.
+    """
+    if os.environ.get("BQ_REUSE_CLIENT", "1") == "1":
+        return _cached_client(project_id, credentials_path)
+    return _create_client(project_id, credentials_path)
+
+
+def _iter_arrow_rows(batches):
+    """Yield row value tuples from Arrow record batches, one column at a time."""
+    for batch in batches:
+        columns = [column.to_pylist() for column in batch.columns]
+        yield from zip(*columns)
+
+
+def _limit_batches(batches, max_rows: int):
+    """Yield Arrow record batches until max_rows rows have been produced."""
+    remaining = max_rows
+    for batch in batches:
+        batch = batch.slice(0, remaining)
+        remaining -= batch.num_rows
+        yield batch
+        if remaining <= 0:
+            return
+
 
 def run_query(
     query: str,
     project_id: str = None,
     credentials_path: str = None,
     output_format: str = "json",
-    max_results: int = 1000
+    max_results: int = 1000,
+    use_storage_api: bool = False,
+    offset: int = None,
+    destination: str = None
 ):
     """
-    Execute a BigQuery SQL query and return results.
+    Execute a BigQuery SQL query and stream results to stdout.
+    
+    When offset is given, returns the page of max_results rows starting at
+    that row, read from the query's destination table, and JSON output is
+    wrapped in a pagination envelope that names that table. Passing the
+    table back as destination reads further pages straight from it,
+    without submitting the query again.
     
     Args:
         query: SQL query string
@@ -27,71 +143,342 @@ def run_query(
         credentials_path: Path to service account JSON (optional, uses default auth if not provided)
         output_format: Output format - 'json', 'csv', or 'table'
         max_results: Maximum number of results to return
-        
+        use_storage_api: Download results over the BigQuery Storage Read API
+        offset: Index of the first row to return (enables pagination)
+        destination: Result table of an earlier paginated run to read the
+            page from instead of running query (enables pagination)
+            
     Returns:
-        Query results in the specified format
+        The completed QueryJob, or None when reading from destination
     """
+    # Reject empty queries before paying for client setup and auth
+    if destination is None and not query.strip():
+        print("Error: Query is empty", file=sys.stderr)
+        sys.exit(1)
+    
+    if use_storage_api and (pyarrow is None or bigquery_storage is None):
+        print(
+            "Error: --use-storage-api requires google-cloud-bigquery-storage and pyarrow",
+            file=sys.stderr
+        )
+        sys.exit(1)
+    
+    if use_storage_api and (offset is not None or destination is not None):
+        print(
+            "Error: --use-storage-api cannot be combined with --offset or --destination",
+            file=sys.stderr
+        )
+        sys.exit(1)
+    
     try:
         # Initialize client
-        if credentials_path:
-            credentials = service_account.Credentials.from_service_account_file(
-                credentials_path
+        client, credentials = _get_client(project_id, credentials_path)
+        
+        page = None
+        if destination is not None:
+            # Later page of an earlier run: no query is submitted or billed
+            query_job = None
+        else:
+            # Execute query
+            query_job = client.query(query)
+        
+        if destination is not None or offset is not None:
+            # Read the page straight from the job's destination table and
+            # report that table so later pages can be read from it directly
+            if destination is None:
+                query_job.result()
+                destination = str(query_job.destination)
+            offset = offset or 0
+            results = client.list_rows(
+                destination,
+                start_index=offset,
+                max_results=max_results
+            )
+            if pyarrow is not None:
+                arrow_batches = _limit_batches(results.to_arrow_iterable(), max_results)
+            else:
+                arrow_batches = None
+            
+            total_count = results.total_rows or 0
+            returned_count = max(0, min(max_results, total_count - offset))
+            has_next = offset + returned_count < total_count
+            page = {
+                "destination": destination,
+                "total_count": total_count,
+                "returned_count": returned_count,
+                "offset": offset,
+                "pagination": {
+                    "limit": max_results,
+                    "has_next": has_next,
+                    "next_offset": offset + returned_count if has_next else None
+                }
+            }
+        elif use_storage_api:
+            # The client library falls back to REST paging whenever
+            # max_results is set, so read unbounded and cut off locally.
+            # Pass the client's credentials object explicitly so the read
+            # client does not fall back to application default credentials.
+            results = query_job.result()
+            bqstorage_client = bigquery_storage.BigQueryReadClient(
+                credentials=credentials
+            )
+            arrow_batches = _limit_batches(
+                results.to_arrow_iterable(bqstorage_client=bqstorage_client),
+                max_results
             )
-            client = bigquery.Client(credentials=credentials, project=project_id)
         else:
-            client = bigquery.Client(project=project_id)
+            results = query_job.result(max_results=max_results)
+            arrow_batches = results.to_arrow_iterable() if pyarrow is not None else None
         
-        # Execute query
-        query_job = client.query(query)
-        results = query_job.result(max_results=max_results)
+        headers = [field.name for field in results.schema]
         
-        # Convert to list of dictionaries
-        rows = []
-        for row in results:
-            rows.append(dict(row))
+        # Convert results column-wise through Arrow when pyarrow is
+        # installed, instead of building a Python object per row
+        if arrow_batches is not None:
+            batches = (batch for batch in arrow_batches if batch.num_rows)
+            first_batch = next(batches, None)
+            has_rows = first_batch is not None
+            if has_rows:
+                batches = itertools.chain([first_batch], batches)
+            rows = _iter_arrow_rows(batches)
+        else:
+            rows = (row.values() for row in results)
+            first_row = next(rows, None)
+            has_rows = first_row is not None
+            if has_rows:
+                rows = itertools.chain([first_row], rows)
         
-        # Format output
-        if output_format == "json":
-            output = json.dumps(rows, indent=2, default=str)
-        elif output_format == "csv":
-            if rows:
-                import csv
-                import io
-                output_buffer = io.StringIO()
-                writer = csv.DictWriter(output_buffer, fieldnames=rows[0].keys())
-                writer.writeheader()
+        # Stream rows straight to stdout instead of collecting them first
+        if output_format == "csv":
+            if has_rows:
+                # Rows are already positional tuples in header order, so
+                # csv.writer can consume them without any per-field lookup.
+                # Arrow-converted rows go through the same writer so the CSV
+                # dialect does not depend on the result schema.
+                writer = csv.writer(sys.stdout)
+                writer.writerow(headers)
                 writer.writerows(rows)
-                output = output_buffer.getvalue()
-            else:
-                output = ""
         elif output_format == "table":
-            if rows:
+            if has_rows:
                 # Simple table format
-                headers = list(rows[0].keys())
-                output = " | ".join(headers) + "\n"
-                output += "-" * len(output) + "\n"
-                for row in rows:
-                    output += " | ".join(str(row[h]) for h in headers) + "\n"
+                header_line = " | ".join(headers) + "\n"
+                sys.stdout.write(header_line)
+                sys.stdout.write("-" * len(header_line) + "\n")
+                for values in rows:
+                    sys.stdout.write(" | ".join(str(value) for value in values) + "\n")
             else:
-                output = "No results"
+                sys.stdout.write("No results\n")
         else:
-            output = json.dumps(rows, indent=2, default=str)
+            # Same layout as json.dumps(rows, indent=2), one row at a time
+            indent = "  "
+            if page is not None:
+                # Emit the envelope keys one by one, then stream the rows
+                # as its final "data" member
+                sys.stdout.write("{\n")
+                for key, value in page.items():
+                    value_json = _dumps(value).replace("\n", "\n  ")
+                    sys.stdout.write(f"  {json.dumps(key)}: {value_json},\n")
+                sys.stdout.write('  "data": ')
+                indent = "    "
+            if has_rows:
+                sys.stdout.write("[\n")
+                for i, values in enumerate(rows):
+                    if i:
+                        sys.stdout.write(",\n")
+                    row_json = _dumps(dict(zip(headers, values)))
+                    sys.stdout.write(indent + row_json.replace("\n", "\n" + indent))
+                sys.stdout.write("\n" + indent[:-2] + "]")
+            else:
+                sys.stdout.write("[]")
+            if page is not None:
+                sys.stdout.write("\n}")
+            sys.stdout.write("\n")
+        sys.stdout.flush()
+        
+        if page is not None and page["returned_count"]:
+            print(
+                f"Rows {offset + 1}-{offset + page['returned_count']} of {page['total_count']}",
+                file=sys.stderr
+            )
+            if page["pagination"]["has_next"]:
+                print(
+                    f"Next page: --destination {destination} "
+                    f"--offset {page['pagination']['next_offset']}",
+                    file=sys.stderr
+                )
+        elif page is not None:
+            print(f"No rows at offset {offset} of {page['total_count']}", file=sys.stderr)
         
         # Print metadata
+        if query_job is None:
+            print(f"Read page from {destination}.", file=sys.stderr)
+            print(f"Total rows: {results.total_rows}", file=sys.stderr)
+            return None
         print(f"Query completed successfully.", file=sys.stderr)
         print(f"Total rows: {results.total_rows}", file=sys.stderr)
         print(f"Bytes processed: {query_job.total_bytes_processed:,}", file=sys.stderr)
         
-        return output
+        return query_job
         
     except Exception as e:
         print(f"Error executing query: {str(e)}", file=sys.stderr)
         sys.exit(1)
 
 
+def _normalize_sql(query: str) -> str:
+    """Strip comments and collapse whitespace so formatting-only edits share a cache entry."""
+    return _SQL_TOKEN_RE.sub(lambda m: m.group(1) or " ", query).strip()
+
+
+def _cache_path(
+    query: str,
+    project_id: str,
+    credentials_path: str,
+    output_format: str,
+    max_results: int,
+    use_storage_api: bool = False,
+    offset: int = None
+) -> str:
+    """Return the cache file path for a query, its credentials and output options."""
+    if credentials_path:
+        credentials_path = os.path.abspath(credentials_path)
+    key = json.dumps([
+        _normalize_sql(query), project_id, credentials_path,
+        output_format, max_results, use_storage_api, offset
+    ])
+    return os.path.join(CACHE_DIR, hashlib.sha256(key.encode("utf-8")).hexdigest())
+
+
+def _prune_cache(max_age: int):
+    """Delete cache entries older than max_age seconds."""
+    cutoff = time.time() - max_age
+    try:
+        with os.scandir(CACHE_DIR) as entries:
+            for entry in entries:
+                # Skip in-progress temp files of concurrent runs
+                if entry.name.startswith("tmp"):
+                    continue
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                except OSError:
+                    pass
+    except OSError:
+        pass
+
+
+class _TeeWriter(io.IOBase):
+    """Writable stream that duplicates everything written to several streams."""
+    
+    def __init__(self, *streams):
+        self._streams = streams
+    
+    def writable(self):
+        return True
+    
+    def write(self, data):
+        for stream in self._streams:
+            stream.write(data)
+        return len(data)
+    
+    def flush(self):
+        for stream in self._streams:
+            stream.flush()
+
+
+def run_query_cached(
+    query: str,
+    project_id: str = None,
+    credentials_path: str = None,
+    output_format: str = "json",
+    max_results: int = 1000,
+    use_storage_api: bool = False,
+    offset: int = None,
+    cache_ttl: int = DEFAULT_CACHE_TTL
+):
+    """
+    Execute a query through a local disk cache of its formatted output.
+    
+    Output is cached under ~/.cache/bq-runquery, keyed by the normalized
+    SQL, project, credentials file, output format, max_results, storage API
+    use and offset. A cached result younger than cache_ttl seconds is
+    replayed without contacting BigQuery; older entries are pruned whenever
+    a new result is stored. Only
+    SELECT results are stored, so DML and DDL statements always execute.
+    The cache cannot tell whether a SELECT is deterministic; only use it
+    for queries whose result may be reused for cache_ttl seconds.
+    
+    Args:
+        query: SQL query string
+        project_id: GCP project ID (optional if set in credentials)
+        credentials_path: Path to service account JSON (optional, uses default auth if not provided)
+        output_format: Output format - 'json', 'csv', or 'table'
+        max_results: Maximum number of results to return
+        use_storage_api: Download results over the BigQuery Storage Read API
+        offset: Index of the first row to return (enables pagination)
+        cache_ttl: Maximum age of a cached result in seconds
+    """
+    cache_path = _cache_path(
+        query, project_id, credentials_path, output_format,
+        max_results, use_storage_api, offset
+    )
+    
+    try:
+        if time.time() - os.path.getmtime(cache_path) < cache_ttl:
+            with open(cache_path, "r", newline="") as f:
+                shutil.copyfileobj(f, sys.stdout)
+            sys.stdout.flush()
+            print("Served from local cache.", file=sys.stderr)
+            return
+    except OSError:
+        pass
+    
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR)
+    except OSError:
+        # Cache directory unavailable, run uncached
+        run_query(
+            query, project_id, credentials_path, output_format,
+            max_results, use_storage_api, offset
+        )
+        return
+    
+    try:
+        # Stream to stdout as usual while recording the output; the entry
+        # only becomes visible once the query has completed successfully
+        with os.fdopen(fd, "w", newline="") as cache_file:
+            with contextlib.redirect_stdout(_TeeWriter(sys.stdout, cache_file)):
+                query_job = run_query(
+                    query, project_id, credentials_path, output_format,
+                    max_results, use_storage_api, offset
+                )
+        if query_job.statement_type == "SELECT":
+            os.replace(tmp_path, cache_path)
+            _prune_cache(cache_ttl)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _non_negative_int(value: str) -> int:
+    """argparse type for integer options that must be zero or greater."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be zero or greater, got {number}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(description="Execute BigQuery SQL query")
-    parser.add_argument("query", help="SQL query string or path to .sql file")
+    parser.add_argument(
+        "query",
+        nargs="?",
+        help="SQL query string or path to .sql file (omit with --destination)"
+    )
     parser.add_argument("--project-id", help="GCP project ID")
     parser.add_argument("--credentials", help="Path to service account JSON file")
     parser.add_argument(
@@ -102,33 +489,85 @@ def main():
     )
     parser.add_argument(
         "--max-results",
+        "--limit",
         type=int,
         default=1000,
-        help="Maximum number of results (default: 1000)"
+        help="Maximum number of results, i.e. the page size with --offset (default: 1000)"
+    )
+    parser.add_argument(
+        "--offset",
+        type=_non_negative_int,
+        help="Return the page of results starting at this row; JSON output is "
+             "wrapped in {destination, total_count, returned_count, offset, pagination, data}"
+    )
+    parser.add_argument(
+        "--destination",
+        help="Read a page from the result table reported by an earlier --offset run "
+             "instead of running a query"
+    )
+    parser.add_argument(
+        "--use-storage-api",
+        action="store_true",
+        help="Download results with the BigQuery Storage Read API "
+             "(faster for large results; requires google-cloud-bigquery-storage and pyarrow)"
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse a locally cached result of the same SELECT query instead of running it again"
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=DEFAULT_CACHE_TTL,
+        help=f"With --cache, reuse results younger than this many seconds (default: {DEFAULT_CACHE_TTL})"
     )
     
     args = parser.parse_args()
     
+    if args.query is None and args.destination is None:
+        parser.error("a query is required unless --destination is given")
+    
     # Check if query is a file path
-    query = args.query
+    query = args.query or ""
     if query.endswith(".sql"):
         try:
-            with open(query, "r") as f:
-                query = f.read()
+            with open(query, "rb") as f:
+                # Decode straight from the mapped file rather than reading
+                # it into an intermediate bytes object (mmap rejects empty files)
+                if os.fstat(f.fileno()).st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        with memoryview(mm) as view:
+                            query = str(view, "utf-8")
+                else:
+                    query = ""
         except FileNotFoundError:
             print(f"Error: SQL file not found: {query}", file=sys.stderr)
             sys.exit(1)
     
-    # Run query
-    result = run_query(
-        query=query,
-        project_id=args.project_id,
-        credentials_path=args.credentials,
-        output_format=args.format,
-        max_results=args.max_results
-    )
-    
-    print(result)
+    # Run query; pages read via --destination are never cached
+    if not args.cache or args.destination is not None:
+        run_query(
+            query=query,
+            project_id=args.project_id,
+            credentials_path=args.credentials,
+            output_format=args.format,
+            max_results=args.max_results,
+            use_storage_api=args.use_storage_api,
+            offset=args.offset,
+            destination=args.destination
+        )
+    else:
+        run_query_cached(
+            query=query,
+            project_id=args.project_id,
+            credentials_path=args.credentials,
+            output_format=args.format,
+            max_results=args.max_results,
+            use_storage_api=args.use_storage_api,
+            offset=args.offset,
+            cache_ttl=args.cache_ttl
+        )
 
 
 if __name__ == "__main__":
@@ -15,6 +15,8 @@ PYTHON_SERVER_TEMPLATE = '''from mcp.server.fastmcp import FastMCP
 from mcp.server.auth.settings import AuthSettings
 from mcp.server.auth.provider import TokenVerifier, AccessToken
 import json
+import os
+from datetime import datetime, timezone
 
 # Create MCP server
 mcp = FastMCP(
@@ -23,30 +25,44 @@ mcp = FastMCP(
     stateless_http=True
 )
 
-# Register UI resource
-@mcp.resource("ui://widget/component.html")
-async def get_component():
-    """Serve the React component."""
-    with open("web/dist/component.js", "r") as f:
+# Load component assets
+COMPONENT_JS_PATH = "web/dist/component.js"
+COMPONENT_CSS_PATH = "web/dist/component.css"
+
+# Set WIDGET_DEV_RELOAD=1 to pick up rebuilt assets without restarting
+DEV_RELOAD = os.environ.get("WIDGET_DEV_RELOAD") == "1"
+
+def _component_mtime():
+    """Latest modification time of the built component assets."""
+    mtime = os.stat(COMPONENT_JS_PATH).st_mtime
+    if os.path.exists(COMPONENT_CSS_PATH):
+        mtime = max(mtime, os.stat(COMPONENT_CSS_PATH).st_mtime)
+    return mtime
+
+def _build_component_html():
+    """Render the widget HTML from the built component assets."""
+    with open(COMPONENT_JS_PATH, "r") as f:
         component_js = f.read()
     
     try:
-        with open("web/dist/component.css", "r") as f:
+        with open(COMPONENT_CSS_PATH, "r") as f:
             component_css = f.read()
     except FileNotFoundError:
         component_css = ""
     
-    html = f"""
+    return f"""
 <div id="root"></div>
-{f'<style>{component_css}</style>' if component_css else ''}
-<script type="module">{component_js}</script>
+{{f'<style>{{component_css}}</style>' if component_css else ''}}
+<script type="module">{{component_js}}</script>
     """.strip()
-    
+
+def _build_component_response():
+    """Build the complete resource response for the widget."""
     return {{
         "contents": [{{
             "uri": "ui://widget/component.html",
             "mimeType": "text/html+skybridge",
-            "text": html,
+            "text": _build_component_html(),
             "_meta": {{
                 "openai/widgetPrefersBorder": True,
                 "openai/widgetDomain": "https://chatgpt.com",
@@ -58,6 +74,30 @@ async def get_component():
         }}]
     }}
 
+# The response never changes between requests, so build it once at import.
+# Take the mtime first so a rebuild during the read is picked up on reload.
+_CACHED_MTIME = _component_mtime()
+_COMPONENT_RESPONSE = _build_component_response()
+
+# Register UI resource
+@mcp.resource("ui://widget/component.html")
+async def get_component():
+    """Serve the React component."""
+    global _COMPONENT_RESPONSE, _CACHED_MTIME
+    if DEV_RELOAD:
+        mtime = _component_mtime()
+        if mtime > _CACHED_MTIME:
+            _COMPONENT_RESPONSE = _build_component_response()
+            _CACHED_MTIME = mtime
+    
+    return _COMPONENT_RESPONSE
+
+RESULTS_TEXT = "Found {{}} results for '{{}}'"
+
+def _now_iso():
+    """Current UTC time as an ISO 8601 string."""
+    return datetime.now(timezone.utc).isoformat()
+
 # Register a sample tool
 @mcp.tool()
 async def get_data(query: str) -> dict:
@@ -77,16 +117,9 @@ async def get_data(query: str) -> dict:
     ]
     
     return {{
-        "content": [{{
-            "type": "text",
-            "text": f"Found {{len(results)}} results for '{{query}}'"
-        }}],
-        "structuredContent": {{
-            "results": results
-        }},
-        "_meta": {{
-            "timestamp": "2025-01-01T00:00:00Z"
-        }}
+        "content": [{{"type": "text", "text": RESULTS_TEXT.format(len(results), query)}}],
+        "structuredContent": {{"results": results}},
+        "_meta": {{"timestamp": _now_iso()}}
     }}
 
 # Configure tool metadata
@@ -350,4 +383,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-'''
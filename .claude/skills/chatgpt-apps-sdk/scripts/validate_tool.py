@@ -3,7 +3,18 @@
 Validate MCP tool definitions for ChatGPT Apps SDK.
 
 Usage:
-    python validate_tool.py <tool-definition.json>
+    python validate_tool.py <tool-definition.json> [<path> ...] [--format=text|ndjson]
+    python validate_tool.py --stream <catalog.json> [<path> ...]
+
+Directories are searched recursively for *.json files. With --stream,
+each file is a catalog of the form {"tools": [ ... ]} whose entries are
+parsed and validated one at a time (requires ijson).
+
+The module is fully type-annotated so it can be compiled with mypyc for
+faster batch runs in CI. Build it with `pip install mypy && mypyc validate_tool.py`,
+then run the compiled module with
+`python -c "import validate_tool; validate_tool.main()" <paths>`
+(running the .py file directly always uses the interpreted version).
     
 Tool definition format:
 {
@@ -17,21 +28,37 @@ Tool definition format:
 
 import json
 import sys
-import re
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import ClassVar, Dict, FrozenSet, Iterator, List, Any, Optional, Tuple
+
+try:
+    import ijson  # type: ignore[import-not-found, import-untyped, unused-ignore]
+except ImportError:
+    ijson = None
 
 class ToolValidator:
-    """Validator for MCP tool definitions."""
+    """Validator for MCP tool definitions.
+    
+    Field values come straight from untrusted JSON, so the _validate_*
+    methods take Any and narrow with isinstance checks; narrower
+    annotations would make a mypyc build raise TypeError on malformed
+    input instead of reporting it.
+    """
     
-    REQUIRED_FIELDS = ["name", "title", "description", "inputSchema"]
-    RECOMMENDED_META_FIELDS = [
+    REQUIRED_FIELDS: ClassVar[List[str]] = ["name", "title", "description", "inputSchema"]
+    RECOMMENDED_META_FIELDS: ClassVar[List[str]] = [
         "openai/outputTemplate",
         "openai/toolInvocation/invoking",
         "openai/toolInvocation/invoked"
     ]
+    _ACTION_WORDS: ClassVar[FrozenSet[str]] = frozenset([
+        "get", "fetch", "create", "update", "delete", "search", "find",
+        "list", "show", "display", "calculate", "analyze", "generate"
+    ])
     
-    def __init__(self):
+    def __init__(self) -> None:
         self.errors: List[str] = []
         self.warnings: List[str] = []
     
@@ -50,19 +77,21 @@ class ToolValidator:
         
         return len(self.errors) == 0
     
-    def _validate_required_fields(self, tool_def: Dict[str, Any]):
+    def _validate_required_fields(self, tool_def: Dict[str, Any]) -> None:
         """Check all required fields are present."""
         for field in self.REQUIRED_FIELDS:
             if field not in tool_def:
                 self.errors.append(f"Missing required field: {field}")
     
-    def _validate_name(self, name: Optional[str]):
+    def _validate_name(self, name: Any) -> None:
         """Validate tool name."""
         if not name:
             return
         
-        # Check format (snake_case, alphanumeric + underscore)
-        if not re.match(r'^[a-z][a-z0-9_]*$', name):
+        # Check format (snake_case, alphanumeric + underscore), i.e.
+        # ^[a-z][a-z0-9_]*$ using only C-level str predicates
+        if not (name.isascii() and name[0].isalpha() and name.islower()
+                and name.replace('_', '').isalnum()):
             self.errors.append(
                 f"Tool name '{name}' must be snake_case (lowercase, alphanumeric, underscores)"
             )
@@ -75,7 +104,7 @@ class ToolValidator:
         if len(name) < 3:
             self.warnings.append(f"Tool name '{name}' is very short, consider being more descriptive")
     
-    def _validate_title(self, title: Optional[str]):
+    def _validate_title(self, title: Any) -> None:
         """Validate tool title."""
         if not title:
             return
@@ -87,17 +116,14 @@ class ToolValidator:
         if len(title) < 5:
             self.warnings.append("Tool title is very short, consider being more descriptive")
     
-    def _validate_description(self, description: Optional[str]):
+    def _validate_description(self, description: Any) -> None:
         """Validate tool description."""
         if not description:
             return
         
         # Check if action-oriented
-        action_words = ["get", "fetch", "create", "update", "delete", "search", "find", 
-                       "list", "show", "display", "calculate", "analyze", "generate"]
-        
         first_word = description.lower().split()[0] if description else ""
-        if first_word not in action_words:
+        if first_word not in self._ACTION_WORDS:
             self.warnings.append(
                 "Description should be action-oriented (start with verbs like 'Get', 'Create', etc.)"
             )
@@ -113,7 +139,7 @@ class ToolValidator:
                 "Description is short, consider adding more detail about when to use this tool"
             )
     
-    def _validate_input_schema(self, schema: Optional[Dict[str, Any]]):
+    def _validate_input_schema(self, schema: Any) -> None:
         """Validate JSON Schema."""
         if not schema:
             return
@@ -127,7 +153,7 @@ class ToolValidator:
             self.warnings.append("inputSchema should have type: 'object'")
         
         # Check properties are documented
-        properties = schema.get("properties", {})
+        properties: Any = schema.get("properties", {})
         for prop_name, prop_schema in properties.items():
             if "description" not in prop_schema:
                 self.warnings.append(
@@ -135,14 +161,14 @@ class ToolValidator:
                 )
         
         # Check required fields exist
-        required = schema.get("required", [])
+        required: Any = schema.get("required", [])
         for req_field in required:
             if req_field not in properties:
                 self.errors.append(
                     f"Required field '{req_field}' not defined in properties"
                 )
     
-    def _validate_meta(self, meta: Dict[str, Any]):
+    def _validate_meta(self, meta: Any) -> None:
         """Validate _meta field."""
         if not meta:
             self.warnings.append(
@@ -181,7 +207,7 @@ class ToolValidator:
             if not isinstance(meta["openai/widgetAccessible"], bool):
                 self.errors.append("openai/widgetAccessible must be boolean")
     
-    def _validate_security_schemes(self, schemes: Optional[List[Dict[str, Any]]]):
+    def _validate_security_schemes(self, schemes: Any) -> None:
         """Validate security schemes."""
         if not schemes:
             self.warnings.append(
@@ -208,7 +234,7 @@ class ToolValidator:
                 if "scopes" in scheme and not isinstance(scheme["scopes"], list):
                     self.errors.append("OAuth2 scopes must be an array")
     
-    def print_results(self):
+    def print_results(self) -> None:
         """Print validation results."""
         if self.errors:
             print("❌ ERRORS:")
@@ -229,41 +255,151 @@ class ToolValidator:
         else:
             print("❌ Tool definition has errors")
 
-def load_tool_definition(filepath: str) -> Optional[Dict[str, Any]]:
-    """Load tool definition from JSON file."""
+def read_tool_definition(filepath: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Load tool definition from JSON file. Returns (definition, error)."""
     try:
         with open(filepath, 'r') as f:
-            return json.load(f)
+            tool_def = json.load(f)
     except FileNotFoundError:
-        print(f"Error: File not found: {filepath}")
-        return None
+        return None, f"File not found: {filepath}"
     except json.JSONDecodeError as e:
-        print(f"Error: Invalid JSON: {e}")
-        return None
+        return None, f"Invalid JSON: {e}"
+    except UnicodeDecodeError as e:
+        return None, f"File is not valid UTF-8: {e}"
+    except OSError as e:
+        return None, f"Cannot read file: {e}"
+    
+    if not isinstance(tool_def, dict):
+        return None, "Tool definition is not a JSON object"
+    return tool_def, None
 
-def main():
-    if len(sys.argv) != 2:
-        print("Usage: python validate_tool.py <tool-definition.json>")
-        sys.exit(1)
+def load_tool_definition(filepath: str) -> Optional[Dict[str, Any]]:
+    """Load tool definition from JSON file."""
+    tool_def, error = read_tool_definition(filepath)
+    if error:
+        print(f"Error: {error}")
+    return tool_def
+
+def iter_catalog_tools(
+    filepath: str
+) -> Iterator[Tuple[Optional[str], Optional[Dict[str, Any]], Optional[str]]]:
+    """Stream tool definitions from a {"tools": [...]} catalog. Yields (name, definition, error)."""
+    found = False
+    try:
+        with open(filepath, 'rb') as f:
+            for index, tool_def in enumerate(ijson.items(f, 'tools.item')):
+                found = True
+                if not isinstance(tool_def, dict):
+                    yield f"#{index}", None, "Tool definition is not a JSON object"
+                    continue
+                yield tool_def.get("name") or f"#{index}", tool_def, None
+    except FileNotFoundError:
+        yield None, None, f"File not found: {filepath}"
+        return
+    except ijson.JSONError as e:
+        yield None, None, f"Invalid JSON: {e}"
+        return
+    except OSError as e:
+        yield None, None, f"Cannot read file: {e}"
+        return
     
-    filepath = sys.argv[1]
+    if not found:
+        yield None, None, 'No tools found (expected a {"tools": [...]} catalog)'
+
+def collect_tool_files(paths: List[str]) -> List[str]:
+    """Expand directories into the *.json files they contain."""
+    filepaths: List[str] = []
+    for path in paths:
+        if Path(path).is_dir():
+            filepaths.extend(str(p) for p in sorted(Path(path).rglob("*.json")))
+        else:
+            filepaths.append(path)
+    return filepaths
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Validate MCP tool definitions for ChatGPT Apps SDK"
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        help="Tool definition JSON files, or directories to search for *.json"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "ndjson"],
+        default="text",
+        help="Output format (default: text)"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help='Treat each file as a {"tools": [...]} catalog and validate entries '
+             'as they are parsed, without loading the whole file (requires ijson)'
+    )
+    
+    args = parser.parse_args()
     
-    # Load tool definition
-    tool_def = load_tool_definition(filepath)
-    if tool_def is None:
+    if args.stream and ijson is None:
+        print("Error: --stream requires ijson (pip install ijson)")
         sys.exit(1)
     
-    # Validate
+    filepaths = collect_tool_files(args.paths)
+    if not filepaths:
+        print(f"Error: No tool definition files found in: {', '.join(args.paths)}")
+        sys.exit(1)
+    
+    if args.stream:
+        entries = (
+            (filepath, tool_name, tool_def, error)
+            for filepath in filepaths
+            for tool_name, tool_def, error in iter_catalog_tools(filepath)
+        )
+    else:
+        # Load all definitions concurrently, then validate in a single loop
+        # with one validator instance
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            loaded = list(executor.map(read_tool_definition, filepaths))
+        entries = (
+            (filepath, None, tool_def, error)
+            for filepath, (tool_def, error) in zip(filepaths, loaded)
+        )
+    
     validator = ToolValidator()
-    is_valid = validator.validate(tool_def)
+    all_valid = True
     
-    # Print results
-    print(f"Validating: {filepath}")
-    print()
-    validator.print_results()
+    for i, (filepath, tool_name, tool_def, error) in enumerate(entries):
+        if tool_def is None:
+            is_valid = False
+            errors, warnings = [error or "Tool definition is empty"], []
+        else:
+            is_valid = validator.validate(tool_def)
+            errors, warnings = validator.errors, validator.warnings
+        all_valid = all_valid and is_valid
+        
+        # Print results
+        if args.format == "ndjson":
+            record: Dict[str, Any] = {"file": filepath}
+            if tool_name is not None:
+                record["tool"] = tool_name
+            record.update(valid=is_valid, errors=errors, warnings=warnings)
+            print(json.dumps(record))
+            continue
+        
+        if i:
+            print()
+        if tool_name is not None:
+            print(f"Validating: {filepath} [{tool_name}]")
+        else:
+            print(f"Validating: {filepath}")
+        print()
+        if tool_def is None:
+            print(f"Error: {errors[0]}")
+        else:
+            validator.print_results()
     
     # Exit with appropriate code
-    sys.exit(0 if is_valid else 1)
+    sys.exit(0 if all_valid else 1)
 
 if __name__ == "__main__":
     main()